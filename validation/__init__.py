@@ -11,6 +11,7 @@ from validation.validator import LearningValidator, ValidationResult
 from validation.config import ValidationConfig
 from validation.metrics import MetricsCollector, MemorySnapshot
 from validation.artifacts import ArtifactManager
+from validation.llm_cache import FileLLMCache
 from validation.assertions import (
     assert_cost_within_budget,
     assert_evolution_triggered,
@@ -22,6 +23,7 @@ from validation.assertions import (
 
 __all__ = [
     "ArtifactManager",
+    "FileLLMCache",
     "LearningValidator",
     "MemorySnapshot",
     "MetricsCollector",
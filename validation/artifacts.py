@@ -10,13 +10,101 @@ Saves validation artifacts for inspection:
 from __future__ import annotations
 
 import json
-from dataclasses import asdict
-from datetime import datetime, timezone
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
+
+import numpy as np
 
 from validation.metrics import MemorySnapshot
 
+# orjson is preferred (faster serialization, writes bytes directly); stdlib json is the fallback
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert NumPy values for the stdlib json fallback."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, using orjson when available.
+
+    NumPy arrays and scalars are serialized natively, so metrics can be
+    passed without .tolist() conversion.
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, indent=2, default=_json_default).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), default=_json_default).encode("utf-8")
+
+
+# Report template, parsed once at import; optional sections are filled in
+# from _SECTION_TEMPLATES keyed by their metrics group
+_REPORT_TEMPLATE = (
+    "# Validation Report\n"
+    "\n"
+    "**Generated:** {generated}\n"
+    "\n"
+    "## Summary\n"
+    "\n"
+    "- **Total Calls:** {total_calls}\n"
+    "- **Total Tokens:** {total_tokens:,}\n"
+    "- **Cache Hits:** {cache_hits}\n"
+    "- **Estimated Cost:** ${estimated_cost_usd:.4f}\n"
+    "{latency_section}"
+    "{quality_section}"
+    "{memory_section}"
+)
+
+_SECTION_TEMPLATES = {
+    "latency": (
+        "## Latency\n"
+        "\n"
+        "- **Min:** {min_s:.2f}s\n"
+        "- **Max:** {max_s:.2f}s\n"
+        "- **Mean:** {mean_s:.2f}s\n"
+        "- **P95:** {p95_s:.2f}s\n"
+    ),
+    "quality": (
+        "## Quality\n"
+        "\n"
+        "- **Min:** {min:.3f}\n"
+        "- **Max:** {max:.3f}\n"
+        "- **Mean:** {mean:.3f}\n"
+        "- **Std Dev:** {std_dev:.3f}\n"
+    ),
+    "memory": (
+        "## Memory Growth\n"
+        "\n"
+        "- **Initial Files:** {initial_files}\n"
+        "- **Final Files:** {final_files}\n"
+        "- **Files Created:** {files_created}\n"
+        "- **Size Growth:** {size_growth_bytes:,} bytes\n"
+        "- **Patterns Created:** {patterns_created}\n"
+        "- **Evolutions Triggered:** {evolutions_triggered}\n"
+    ),
+}
+
+
+def _noop(*args: Any, **kwargs: Any) -> None:
+    """Stand-in for ArtifactManager savers when artifacts are disabled."""
+
 
 class ArtifactManager:
     """Manage validation artifacts.
@@ -33,29 +121,87 @@ class ArtifactManager:
         self.artifacts_dir = artifacts_dir
         self._enabled = artifacts_dir is not None
 
+        # Pending calls.jsonl entries, written in batches to amortize open/write syscalls
+        self._log_buffer: list[dict[str, Any]] = []
+        self._log_flush_threshold = 32
+
+        # calls.jsonl handle, opened on first flush and kept until close()
+        self._log_fp: IO[bytes] | None = None
+
+        # Log timestamps are monotonic offsets from run start, resolved on flush
+        self._run_start = datetime.now(timezone.utc)
+        self._run_start_ns = time.monotonic_ns()
+
         if self._enabled and not artifacts_dir.exists():
             artifacts_dir.mkdir(parents=True, exist_ok=True)
 
+        # Disabled: bind the hot-path savers to a no-op instead of branching per call.
+        # generate_report still renders (callers log the text).
+        if not self._enabled:
+            self.save_log = _noop
+            self.flush_logs = _noop
+            self.save_snapshot = _noop
+            self.save_metrics = _noop
+
     def save_log(self, call_index: int, call_data: dict[str, Any]) -> None:
         """Save log entry for a single LLM call.
 
+        Entries are buffered and written in batches; call flush_logs()
+        to force pending entries to disk.
+
         Args:
             call_index: Index of this call (0-based).
             call_data: Dict with task, response, quality_score, duration_s, etc.
         """
-        if not self._enabled:
-            return
-
-        log_file = self.artifacts_dir / "calls.jsonl"
-
         entry = {
             "call_index": call_index,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "t_offset_ns": time.monotonic_ns() - self._run_start_ns,
             **call_data,
         }
 
-        with log_file.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(entry) + "\n")
+        self._log_buffer.append(entry)
+        if len(self._log_buffer) >= self._log_flush_threshold:
+            self._write_log_buffer()
+
+    def flush_logs(self) -> None:
+        """Write buffered log entries to calls.jsonl and flush them to disk.
+
+        Safe to call when the buffer is empty or artifacts are disabled.
+        """
+        self._write_log_buffer()
+
+        if self._log_fp is not None:
+            self._log_fp.flush()
+
+    def _write_log_buffer(self) -> None:
+        """Serialize buffered entries into the calls.jsonl handle.
+
+        Absolute timestamps are resolved from each entry's monotonic offset
+        and the batch is handed to a persistent, 64 KiB-buffered file
+        handle, so a write syscall is only issued when that buffer fills
+        or on flush_logs().
+        """
+        if not self._log_buffer:
+            return
+
+        lines = []
+        for entry in self._log_buffer:
+            offset = timedelta(microseconds=entry["t_offset_ns"] / 1000)
+            lines.append(_dumps({"timestamp": (self._run_start + offset).isoformat(), **entry}))
+
+        if self._log_fp is None:
+            self._log_fp = (self.artifacts_dir / "calls.jsonl").open("ab", buffering=1 << 16)
+
+        self._log_fp.write(b"\n".join(lines) + b"\n")
+        self._log_buffer.clear()
+
+    def close(self) -> None:
+        """Flush pending log entries and close the calls.jsonl handle."""
+        self.flush_logs()
+
+        if self._log_fp is not None:
+            self._log_fp.close()
+            self._log_fp = None
 
     def save_snapshot(self, name: str, snapshot: MemorySnapshot) -> None:
         """Save memory snapshot.
@@ -64,14 +210,11 @@ class ArtifactManager:
             name: Snapshot name (e.g., "initial", "final", "after_evolution").
             snapshot: MemorySnapshot to save.
         """
-        if not self._enabled:
-            return
-
         snapshots_dir = self.artifacts_dir / "snapshots"
         snapshots_dir.mkdir(exist_ok=True)
 
         snapshot_file = snapshots_dir / f"{name}.json"
-        snapshot_file.write_text(json.dumps(asdict(snapshot), indent=2), encoding="utf-8")
+        snapshot_file.write_bytes(_dumps(snapshot.to_dict(), indent=True))
 
     def save_metrics(self, metrics: dict[str, Any]) -> None:
         """Save metrics export.
@@ -79,11 +222,8 @@ class ArtifactManager:
         Args:
             metrics: Metrics dictionary (from MetricsCollector.export()).
         """
-        if not self._enabled:
-            return
-
         metrics_file = self.artifacts_dir / "metrics.json"
-        metrics_file.write_text(json.dumps(metrics, indent=2), encoding="utf-8")
+        metrics_file.write_bytes(_dumps(metrics, indent=True))
 
     def generate_report(self, metrics: dict[str, Any]) -> str:
         """Generate human-readable validation report.
@@ -97,58 +237,16 @@ class ArtifactManager:
         if not metrics:
             return "No metrics available"
 
-        report_lines = [
-            "# Validation Report",
-            "",
-            f"**Generated:** {datetime.now(timezone.utc).isoformat()}",
-            "",
-            "## Summary",
-            "",
-            f"- **Total Calls:** {metrics.get('total_calls', 0)}",
-            f"- **Total Tokens:** {metrics.get('total_tokens', 0):,}",
-            f"- **Estimated Cost:** ${metrics.get('estimated_cost_usd', 0):.4f}",
-            "",
-        ]
-
-        # Latency
-        if latency := metrics.get("latency"):
-            report_lines.extend([
-                "## Latency",
-                "",
-                f"- **Min:** {latency.get('min_s', 0):.2f}s",
-                f"- **Max:** {latency.get('max_s', 0):.2f}s",
-                f"- **Mean:** {latency.get('mean_s', 0):.2f}s",
-                f"- **P95:** {latency.get('p95_s', 0):.2f}s",
-                "",
-            ])
-
-        # Quality
-        if quality := metrics.get("quality"):
-            report_lines.extend([
-                "## Quality",
-                "",
-                f"- **Min:** {quality.get('min', 0):.3f}",
-                f"- **Max:** {quality.get('max', 0):.3f}",
-                f"- **Mean:** {quality.get('mean', 0):.3f}",
-                f"- **Std Dev:** {quality.get('std_dev', 0):.3f}",
-                "",
-            ])
-
-        # Memory
-        if memory := metrics.get("memory"):
-            report_lines.extend([
-                "## Memory Growth",
-                "",
-                f"- **Initial Files:** {memory.get('initial_files', 0)}",
-                f"- **Final Files:** {memory.get('final_files', 0)}",
-                f"- **Files Created:** {memory.get('files_created', 0)}",
-                f"- **Size Growth:** {memory.get('size_growth_bytes', 0):,} bytes",
-                f"- **Patterns Created:** {memory.get('patterns_created', 0)}",
-                f"- **Evolutions Triggered:** {memory.get('evolutions_triggered', 0)}",
-                "",
-            ])
-
-        report = "\n".join(report_lines)
+        # Missing values render as 0; absent sections render as ""
+        fields = defaultdict(int, metrics)
+        fields["generated"] = datetime.now(timezone.utc).isoformat()
+        for name, template in _SECTION_TEMPLATES.items():
+            values = metrics.get(name)
+            fields[f"{name}_section"] = (
+                "\n" + template.format_map(defaultdict(int, values)) if values else ""
+            )
+
+        report = _REPORT_TEMPLATE.format_map(fields)
 
         if self._enabled:
             report_file = self.artifacts_dir / "report.md"
@@ -9,28 +9,36 @@ Provides assertion functions to verify validation success criteria:
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+
+import numpy as np
+
 from validation.metrics import MemorySnapshot
 
 
-def assert_quality_threshold(scores: list[float], min_threshold: float = 0.7) -> None:
+def assert_quality_threshold(
+    scores: Sequence[float] | np.ndarray,
+    min_threshold: float = 0.7,
+) -> None:
     """Assert all quality scores meet minimum threshold.
 
     Args:
-        scores: List of quality scores (0.0-1.0).
+        scores: Quality scores (0.0-1.0), as a list or NumPy array.
         min_threshold: Minimum acceptable score.
 
     Raises:
         AssertionError: If any score is below threshold.
     """
-    if not scores:
+    arr = np.asarray(scores, dtype=np.float64)
+    if arr.size == 0:
         raise AssertionError("No quality scores to validate")
 
-    below_threshold = [s for s in scores if s < min_threshold]
-
-    if below_threshold:
-        failures = len(below_threshold)
-        total = len(scores)
-        min_score = min(scores)
+    # One vectorized comparison; counts are only computed on failure
+    below = arr < min_threshold
+    if below.any():
+        failures = int(below.sum())
+        total = arr.size
+        min_score = float(arr.min())
         raise AssertionError(
             f"{failures}/{total} calls below quality threshold {min_threshold:.2f}. "
             f"Minimum score: {min_score:.3f}"
@@ -72,14 +80,14 @@ def assert_no_crashes(call_results: list[dict]) -> None:
     if not call_results:
         raise AssertionError("No call results to validate")
 
-    failures = [r for r in call_results if not r.get("success", False)]
+    first_failure = next((r for r in call_results if not r.get("success", False)), None)
 
-    if failures:
-        count = len(failures)
+    if first_failure is not None:
+        count = sum(1 for r in call_results if not r.get("success", False))
         total = len(call_results)
         raise AssertionError(
             f"{count}/{total} calls crashed or failed. "
-            f"First failure: {failures[0].get('error', 'Unknown error')}"
+            f"First failure: {first_failure.get('error', 'Unknown error')}"
         )
 
 
@@ -15,6 +15,7 @@ class ValidationConfig(BaseSettings):
 
     All settings can be overridden via environment variables with
     VALIDATION_ prefix (e.g., VALIDATION_QUALITY_THRESHOLD=0.8).
+    Instances are immutable so they can be shared across scenarios.
     """
 
     model_config = SettingsConfigDict(
@@ -22,6 +23,7 @@ class ValidationConfig(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         extra="forbid",
+        frozen=True,
     )
 
     # Quality thresholds
@@ -47,6 +49,34 @@ class ValidationConfig(BaseSettings):
         description="Timeout in seconds for individual LLM calls",
     )
 
+    # Concurrency
+    max_concurrency: int = Field(
+        default=16,
+        ge=1,
+        le=128,
+        description=(
+            "Maximum number of LLM calls in flight at once (1 = sequential). "
+            "With llm_thread_safe, the cost budget can be overshot by up to "
+            "this many calls, since in-flight calls always complete"
+        ),
+    )
+
+    llm_thread_safe: bool = Field(
+        default=False,
+        description=(
+            "Whether LearningLLM may be called from several threads at once. "
+            "Off by default: netanel-core does not document it as thread-safe, "
+            "so calls are serialized (budget overshoot of at most one call)"
+        ),
+    )
+
+    row_marshal_batch_size: int = Field(
+        default=5,
+        ge=1,
+        le=50,
+        description="Tasks per LLM request in LearningValidator.run_scenario_batched",
+    )
+
     # Retry policy
     max_retries: int = Field(
         default=3,
@@ -62,6 +92,25 @@ class ValidationConfig(BaseSettings):
         description="Delay in seconds between retries",
     )
 
+    # Metrics
+    reservoir_size: int = Field(
+        default=1000,
+        ge=1,
+        description="Maximum number of call durations sampled for latency percentiles",
+    )
+
+    # LLM response cache (opt-in: cache hits bypass LearningLLM entirely,
+    # so no learning or evolution happens for those calls)
+    cache_enabled: bool = Field(
+        default=False,
+        description="Whether to serve repeated LLM calls from the on-disk response cache",
+    )
+
+    cache_dir: str = Field(
+        default=".llm_cache",
+        description="Directory for the LLM response cache",
+    )
+
     # Memory cleanup
     cleanup_memories: bool = Field(
         default=True,
@@ -78,3 +127,8 @@ class ValidationConfig(BaseSettings):
         default="artifacts",
         description="Directory to store validation artifacts",
     )
+
+    verbose_logs: bool = Field(
+        default=True,
+        description="Whether call logs include the (truncated) LLM response",
+    )
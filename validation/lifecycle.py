@@ -3,12 +3,13 @@
 Provides setup/teardown for validation scenarios:
 - Temporary memory directories (isolated per scenario)
 - Artifact directories
-- Cleanup between scenarios
+
+Isolation between scenarios comes from per-test tmp_path directories.
 """
 
 from __future__ import annotations
 
-import shutil
+import functools
 from pathlib import Path
 from typing import Generator
 
@@ -17,20 +18,40 @@ import pytest
 from validation.config import ValidationConfig
 
 
-@pytest.fixture
-def config() -> ValidationConfig:
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register validation command-line options."""
+    parser.addoption(
+        "--no-cache",
+        action="store_true",
+        default=False,
+        help="Disable the LLM response cache for this run",
+    )
+
+
+@functools.cache
+def _default_config() -> ValidationConfig:
+    """Load and validate the default configuration once per process."""
+    return ValidationConfig()
+
+
+@pytest.fixture(scope="session")
+def config(pytestconfig: pytest.Config) -> ValidationConfig:
     """Provide default validation configuration.
 
+    Loaded once per session and shared; ValidationConfig is frozen.
     Can be overridden in tests by passing custom ValidationConfig.
     """
-    return ValidationConfig()
+    if pytestconfig.getoption("no_cache"):
+        return _default_config().model_copy(update={"cache_enabled": False})
+    return _default_config()
 
 
 @pytest.fixture
 def memories_dir(tmp_path: Path) -> Generator[Path, None, None]:
     """Provide isolated temporary memory directory for each scenario.
 
-    Automatically cleans up after test completes.
+    Lives under pytest's tmp_path, so pytest's own retention policy
+    removes it; no manual teardown is needed.
 
     Args:
         tmp_path: Pytest's built-in tmp_path fixture.
@@ -43,10 +64,6 @@ def memories_dir(tmp_path: Path) -> Generator[Path, None, None]:
 
     yield memory_path
 
-    # Cleanup after test
-    if memory_path.exists():
-        shutil.rmtree(memory_path)
-
 
 @pytest.fixture
 def artifacts_dir(tmp_path: Path, config: ValidationConfig) -> Generator[Path, None, None]:
@@ -71,15 +88,3 @@ def artifacts_dir(tmp_path: Path, config: ValidationConfig) -> Generator[Path, N
     yield artifacts_path
 
     # Artifacts are kept for inspection (not cleaned up automatically)
-
-
-@pytest.fixture(autouse=True)
-def isolate_scenarios() -> Generator[None, None, None]:
-    """Ensure complete isolation between scenario runs.
-
-    This fixture runs automatically for all tests.
-    Prevents state leakage between scenarios.
-    """
-    # Setup: nothing needed (isolation via separate memory dirs)
-    yield
-    # Teardown: pytest tmp_path cleanup handles it
@@ -0,0 +1,113 @@
+"""File-based cache for LLM call results.
+
+Lets reruns of the same validation calls skip the API:
+- Keys are SHA-256 hashes of model, prompt version, and normalized task,
+  so prompts differing only in spacing or trailing punctuation
+  share one entry
+- Entries are stored as <cache_dir>/<2-char prefix>/<hash>.json
+- Entries expire after a TTL (7 days by default)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+
+_TRAILING_PUNCTUATION = ".!?;:,"
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Normalize a prompt for content-addressed lookup.
+
+    Collapses whitespace and strips trailing punctuation. Case is kept:
+    identifiers and string literals in code-generation tasks are
+    case-sensitive.
+
+    Args:
+        prompt: Raw prompt text.
+
+    Returns:
+        Normalized prompt.
+    """
+    return " ".join(prompt.split()).rstrip(_TRAILING_PUNCTUATION).rstrip()
+
+
+class FileLLMCache:
+    """On-disk LLM result cache.
+
+    Each entry is a small JSON file holding the cached result and the time
+    it was written. Expired or unreadable entries are treated as misses.
+    """
+
+    def __init__(self, cache_dir: Path, ttl_seconds: float = DEFAULT_TTL_SECONDS) -> None:
+        """Initialize cache.
+
+        Args:
+            cache_dir: Directory holding cache entries (created on first write).
+            ttl_seconds: Maximum age of an entry before it is ignored.
+        """
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def make_key(model: str, task: str, prompt_version: str) -> str:
+        """Build a cache key for an LLM call.
+
+        Args:
+            model: Model name used for the call.
+            task: Task string sent to the LLM (normalized before hashing).
+            prompt_version: Identifier of the (evolved) system prompt, so
+                prompt evolution invalidates earlier entries.
+
+        Returns:
+            Hex-encoded SHA-256 digest.
+        """
+        normalized = normalize_prompt(task)
+        return hashlib.sha256(f"{model}\0{prompt_version}\0{normalized}".encode()).hexdigest()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Look up a cached result.
+
+        Args:
+            key: Cache key from make_key().
+
+        Returns:
+            Cached result dict, or None on miss or expiry.
+        """
+        try:
+            entry = json.loads(self._path(key).read_bytes())
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - entry.get("cached_at", 0) > self.ttl_seconds:
+            return None
+
+        return entry.get("result")
+
+    def set(self, key: str, result: dict[str, Any]) -> None:
+        """Store a result.
+
+        Written to a temp file and renamed, so concurrent readers never see
+        a partial entry.
+
+        Args:
+            key: Cache key from make_key().
+            result: JSON-serializable result dict.
+        """
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        entry = {"cached_at": time.time(), "result": result}
+        tmp_path.write_text(json.dumps(entry), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def _path(self, key: str) -> Path:
+        """Return the file path for a cache key."""
+        return self.cache_dir / key[:2] / f"{key}.json"
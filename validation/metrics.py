@@ -10,17 +10,97 @@ Tracks performance and quality metrics:
 from __future__ import annotations
 
 import math
+import os
+import random
 import time
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 
-@dataclass
+# gpt-4o-mini average price: ($0.15 + $0.60) / 2 = $0.375 per 1M tokens
+_COST_PER_TOKEN_USD = 0.375 / 1_000_000
+
+
+def cost_for_tokens(tokens: int) -> float:
+    """Estimate the USD cost of a token count (see MetricsCollector._estimate_cost)."""
+    return tokens * _COST_PER_TOKEN_USD
+
+
+# Directory listings cached by path: (dir st_mtime_ns, [(name, is_dir), ...])
+DirListingCache = dict[str, tuple[int, list[tuple[str, bool]]]]
+
+# Listings of directories modified this recently are not cached: a change
+# within the filesystem's timestamp granularity would leave mtime unchanged
+_RACY_MTIME_NS = 2_000_000_000
+
+
+def _iter_files(
+    root: str,
+    listing_cache: DirListingCache | None = None,
+) -> Iterator[tuple[str, str, int]]:
+    """Yield (parent dir name, file name, size) for every file under root.
+
+    Iterative scandir walk: no Path objects are built, DirEntry type checks
+    avoid extra syscalls, and symlinks are not followed. The parent name is
+    "" for files directly in root.
+
+    With a listing_cache, directories whose mtime is unchanged since the
+    last walk are not re-listed; only their files are stat'ed for sizes.
+    """
+    now_ns = time.time_ns()
+    stack = [(root, "")]
+    while stack:
+        path, dir_name = stack.pop()
+
+        cached = None
+        if listing_cache is not None:
+            mtime_ns = os.stat(path).st_mtime_ns
+            cached = listing_cache.get(path)
+            if cached is not None and cached[0] != mtime_ns:
+                cached = None
+
+        if cached is not None:
+            for name, is_dir in cached[1]:
+                child = os.path.join(path, name)
+                if is_dir:
+                    stack.append((child, name))
+                    continue
+                try:
+                    yield dir_name, name, os.lstat(child).st_size
+                except FileNotFoundError:
+                    continue
+            continue
+
+        listing = []
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    listing.append((entry.name, True))
+                    stack.append((entry.path, entry.name))
+                elif entry.is_file(follow_symlinks=False):
+                    listing.append((entry.name, False))
+                    yield dir_name, entry.name, entry.stat(follow_symlinks=False).st_size
+
+        if listing_cache is not None and now_ns - mtime_ns > _RACY_MTIME_NS:
+            listing_cache[path] = (mtime_ns, listing)
+
+
+def _percentile_index(p: float, count: int) -> int:
+    """Calculate nearest-rank percentile index (ceil without math.ceil)."""
+    rank = p * count
+    idx = int(rank) if rank.is_integer() else int(rank) + 1
+    return min(max(0, idx - 1), count - 1)
+
+
+@dataclass(slots=True, frozen=True)
 class MemorySnapshot:
     """Snapshot of memory state at a point in time.
 
-    Used to track memory growth between validation runs.
+    Used to track memory growth between validation runs. Immutable and
+    slotted, so instances are small and can be shared safely.
     """
 
     timestamp: float
@@ -29,12 +109,28 @@ class MemorySnapshot:
     pattern_count: int = 0
     evolution_count: int = 0
 
+    def to_dict(self) -> dict[str, Any]:
+        """Return snapshot fields as a plain dict for serialization."""
+        return {
+            "timestamp": self.timestamp,
+            "total_files": self.total_files,
+            "total_size_bytes": self.total_size_bytes,
+            "pattern_count": self.pattern_count,
+            "evolution_count": self.evolution_count,
+        }
+
     @classmethod
-    def capture(cls, memories_dir: Path) -> MemorySnapshot:
+    def capture(
+        cls,
+        memories_dir: Path,
+        listing_cache: DirListingCache | None = None,
+    ) -> MemorySnapshot:
         """Capture current state of memory directory.
 
         Args:
             memories_dir: Path to memories directory.
+            listing_cache: Optional directory listing cache reused across
+                captures, so unchanged directories are not re-listed.
 
         Returns:
             MemorySnapshot with current state.
@@ -46,17 +142,22 @@ class MemorySnapshot:
                 total_size_bytes=0,
             )
 
-        files = list(memories_dir.rglob("*"))
         total_files = 0
         total_size = 0
-        for f in files:
-            if f.is_file():
-                total_files += 1
-                total_size += f.stat().st_size
+        pattern_count = 0
+        evolution_count = 0
+
+        # Single pass: netanel-core stores patterns as .md files in patterns/ dirs
+        # and evolved prompts as .md files in prompts/ dirs
+        for dir_name, name, size in _iter_files(os.fspath(memories_dir), listing_cache):
+            total_files += 1
+            total_size += size
 
-        # Count patterns and evolutions (netanel-core uses .md files in patterns/ dirs)
-        pattern_count = len(list(memories_dir.glob("**/patterns/*.md")))
-        evolution_count = len(list(memories_dir.glob("**/prompts/*.md")))
+            if name.endswith(".md"):
+                if dir_name == "patterns":
+                    pattern_count += 1
+                elif dir_name == "prompts":
+                    evolution_count += 1
 
         return cls(
             timestamp=time.time(),
@@ -67,6 +168,34 @@ class MemorySnapshot:
         )
 
 
+@dataclass
+class _RunningStats:
+    """Running count, mean, variance (Welford's algorithm), min and max.
+
+    Updated in O(1) per sample so statistics never rescan history.
+    """
+
+    n: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    min: float = math.inf
+    max: float = -math.inf
+
+    def update(self, x: float) -> None:
+        """Add a sample."""
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+        self.min = min(self.min, x)
+        self.max = max(self.max, x)
+
+    @property
+    def std_dev(self) -> float:
+        """Population standard deviation."""
+        return math.sqrt(self.m2 / self.n) if self.n else 0.0
+
+
 @dataclass
 class MetricsCollector:
     """Collect and analyze validation metrics.
@@ -74,8 +203,11 @@ class MetricsCollector:
     Tracks all performance and quality metrics for a validation run.
     """
 
-    # Latency tracking
+    # Latency tracking (raw durations are only kept for percentiles, as a
+    # uniform reservoir sample of at most reservoir_size calls)
     call_durations: list[float] = field(default_factory=list)
+    percentiles_enabled: bool = True
+    reservoir_size: int = 1000
 
     # Quality tracking
     quality_scores: list[float] = field(default_factory=list)
@@ -83,15 +215,26 @@ class MetricsCollector:
     # Cost tracking (estimated)
     total_tokens: int = 0
     total_calls: int = 0
+    cache_hits: int = 0
+    _running_cost_usd: float = field(default=0.0, init=False, repr=False)
 
     # Memory snapshots
     snapshots: list[MemorySnapshot] = field(default_factory=list)
 
+    # Incremental statistics, updated per call
+    _latency: _RunningStats = field(default_factory=_RunningStats, init=False, repr=False)
+    _quality: _RunningStats = field(default_factory=_RunningStats, init=False, repr=False)
+
+    # Directory listings reused across snapshots; unchanged directories
+    # (same st_mtime_ns) are not re-listed
+    _listing_cache: DirListingCache = field(default_factory=dict, init=False, repr=False)
+
     def record_call(
         self,
         duration_s: float,
         quality_score: float,
         tokens_used: int = 0,
+        cached: bool = False,
     ) -> None:
         """Record metrics for a single LLM call.
 
@@ -99,22 +242,56 @@ class MetricsCollector:
             duration_s: Call duration in seconds.
             quality_score: Quality score (0.0-1.0).
             tokens_used: Number of tokens consumed.
+            cached: Whether the call was served from the response cache.
+                Cache hits are counted but kept out of latency statistics.
         """
-        self.call_durations.append(duration_s)
+        self._quality.update(quality_score)
         self.quality_scores.append(quality_score)
         self.total_tokens += tokens_used
         self.total_calls += 1
+        self._running_cost_usd += cost_for_tokens(tokens_used)
+
+        if cached:
+            self.cache_hits += 1
+            return
+
+        self._latency.update(duration_s)
+        if self.percentiles_enabled:
+            # Reservoir sampling (Vitter's Algorithm R) bounds memory on long runs
+            if len(self.call_durations) < self.reservoir_size:
+                self.call_durations.append(duration_s)
+            else:
+                slot = random.randrange(self._latency.n)
+                if slot < self.reservoir_size:
+                    self.call_durations[slot] = duration_s
+
+    def add_tokens(self, tokens_used: int) -> None:
+        """Count tokens spent outside a recorded call (e.g. a discarded request).
+
+        Args:
+            tokens_used: Number of tokens consumed.
+        """
+        self.total_tokens += tokens_used
+        self._running_cost_usd += cost_for_tokens(tokens_used)
+
+    @property
+    def cost_usd(self) -> float:
+        """Estimated cost so far in USD (see _estimate_cost)."""
+        return self._running_cost_usd
 
     def snapshot_memory(self, memories_dir: Path) -> MemorySnapshot:
         """Capture and store memory snapshot.
 
+        Every directory is checked, but only those whose mtime changed
+        since the previous snapshot are re-listed.
+
         Args:
             memories_dir: Path to memories directory.
 
         Returns:
             MemorySnapshot with current state.
         """
-        snapshot = MemorySnapshot.capture(memories_dir)
+        snapshot = MemorySnapshot.capture(memories_dir, self._listing_cache)
         self.snapshots.append(snapshot)
         return snapshot
 
@@ -127,6 +304,7 @@ class MetricsCollector:
         return {
             "total_calls": self.total_calls,
             "total_tokens": self.total_tokens,
+            "cache_hits": self.cache_hits,
             "estimated_cost_usd": self._estimate_cost(),
             "latency": self._latency_stats(),
             "quality": self._quality_stats(),
@@ -137,42 +315,46 @@ class MetricsCollector:
         """Estimate total cost in USD.
 
         Uses gpt-4o-mini pricing: $0.15/1M input, $0.60/1M output.
-        Assumes 50/50 split for simplicity.
+        Assumes 50/50 split for simplicity. Accumulated in record_call, so
+        this is a constant-time read suitable for per-call budget checks.
 
         Returns:
             Estimated cost in USD.
         """
-        if self.total_tokens == 0:
-            return 0.0
-
-        # Average price: ($0.15 + $0.60) / 2 = $0.375 per 1M tokens
-        avg_price_per_million = 0.375
-        return (self.total_tokens / 1_000_000) * avg_price_per_million
+        return self._running_cost_usd
 
     def _latency_stats(self) -> dict[str, float]:
         """Calculate latency statistics.
 
+        Cache hits are excluded. Percentiles are only included when
+        percentiles_enabled is set, and are approximate once more than
+        reservoir_size calls are recorded.
+
         Returns:
             Dict with min, max, mean, p50, p95, p99 latencies.
         """
-        if not self.call_durations:
+        latency = self._latency
+        if latency.n == 0:
             return {}
 
-        sorted_durations = sorted(self.call_durations)
-        n = len(sorted_durations)
+        stats = {
+            "min_s": latency.min,
+            "max_s": latency.max,
+            "mean_s": latency.mean,
+        }
 
-        def percentile_index(p: float, count: int) -> int:
-            """Calculate nearest-rank percentile index."""
-            return min(max(0, math.ceil(p * count) - 1), count - 1)
+        if not self.call_durations:
+            return stats
 
-        return {
-            "min_s": sorted_durations[0],
-            "max_s": sorted_durations[-1],
-            "mean_s": sum(sorted_durations) / n,
-            "p50_s": sorted_durations[percentile_index(0.50, n)],
-            "p95_s": sorted_durations[percentile_index(0.95, n)],
-            "p99_s": sorted_durations[percentile_index(0.99, n)],
-        }
+        arr = np.asarray(self.call_durations, dtype=np.float64)
+        n = arr.size
+
+        # Partial sort (introselect): only the requested order statistics are placed
+        indices = [_percentile_index(p, n) for p in (0.50, 0.95, 0.99)]
+        p50, p95, p99 = np.partition(arr, indices)[indices]
+
+        stats.update(p50_s=float(p50), p95_s=float(p95), p99_s=float(p99))
+        return stats
 
     def _quality_stats(self) -> dict[str, float]:
         """Calculate quality score statistics.
@@ -180,19 +362,15 @@ class MetricsCollector:
         Returns:
             Dict with min, max, mean, std dev of quality scores.
         """
-        if not self.quality_scores:
+        quality = self._quality
+        if quality.n == 0:
             return {}
 
-        n = len(self.quality_scores)
-        mean = sum(self.quality_scores) / n
-        variance = sum((x - mean) ** 2 for x in self.quality_scores) / n
-        std_dev = variance**0.5
-
         return {
-            "min": min(self.quality_scores),
-            "max": max(self.quality_scores),
-            "mean": mean,
-            "std_dev": std_dev,
+            "min": quality.min,
+            "max": quality.max,
+            "mean": quality.mean,
+            "std_dev": quality.std_dev,
         }
 
     def _memory_stats(self) -> dict[str, Any]:
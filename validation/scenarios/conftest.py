@@ -1,8 +1,8 @@
 """Pytest configuration for validation scenarios.
 
-Imports fixtures from validation.lifecycle for use in all scenario tests.
+Imports fixtures and options from validation.lifecycle for use in all scenario tests.
 """
 
-from validation.lifecycle import artifacts_dir, config, isolate_scenarios, memories_dir
+from validation.lifecycle import artifacts_dir, config, memories_dir, pytest_addoption
 
-__all__ = ["config", "memories_dir", "artifacts_dir", "isolate_scenarios"]
+__all__ = ["config", "memories_dir", "artifacts_dir", "pytest_addoption"]
@@ -0,0 +1,117 @@
+"""Row-marshaled batching checks.
+
+Covers batch answer parsing, per-task token/duration attribution and the
+fallback to individual calls in run_scenario_batched. A scripted stand-in
+for LearningLLM is used, so no LLM calls are made and netanel-core is not
+required.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+import validation.validator as validator_module
+from validation.config import ValidationConfig
+from validation.metrics import cost_for_tokens
+from validation.validator import (
+    LearningValidator,
+    _batch_prompt,
+    _parse_batch_answers,
+    _split_batch_usage,
+)
+
+
+class ScriptedLLM:
+    """LearningLLM stand-in: answers batch prompts with a fixed response."""
+
+    def __init__(self, batch_response: str) -> None:
+        self.batch_response = batch_response
+        self.prompts: list[str] = []
+
+    def call(self, task: str) -> SimpleNamespace:
+        self.prompts.append(task)
+        if task.startswith("Return a JSON list"):
+            return SimpleNamespace(response=self.batch_response, score=0.9, tokens_used=100)
+        return SimpleNamespace(response=f"answer to {task}", score=0.8, tokens_used=10)
+
+
+@pytest.fixture
+def make_validator(
+    monkeypatch: pytest.MonkeyPatch,
+    memories_dir: Path,
+    config: ValidationConfig,
+) -> Callable[[str], LearningValidator]:
+    """Build a LearningValidator driven by a ScriptedLLM."""
+    monkeypatch.setattr(validator_module, "NETANEL_CORE_AVAILABLE", True)
+
+    def make(batch_response: str) -> LearningValidator:
+        validator = LearningValidator(
+            namespace="test-batching",
+            memories_dir=memories_dir,
+            config=config.model_copy(update={"cache_enabled": False, "max_cost_usd": 1.0}),
+        )
+        validator._llm = ScriptedLLM(batch_response)
+        return validator
+
+    return make
+
+
+def test_parse_batch_answers() -> None:
+    """Verify answers are extracted only from a list of the expected length."""
+    assert _parse_batch_answers('Sure!\n["a", "b"]\nDone.', 2) == ["a", "b"]
+    assert _parse_batch_answers('["a", {"code": 1}]', 2) == ["a", json.dumps({"code": 1})]
+    assert _parse_batch_answers('["a"]', 2) is None
+    assert _parse_batch_answers("[not json]", 1) is None
+    assert _parse_batch_answers("no list here", 1) is None
+
+
+def test_batch_prompt_numbers_tasks() -> None:
+    """Verify tasks are numbered in order in the batched prompt."""
+    prompt = _batch_prompt(["first", "second"])
+    assert "1. first\n2. second" in prompt
+
+
+def test_split_batch_usage() -> None:
+    """Verify tokens and duration are split by answer length and sum to the request's."""
+    usage = _split_batch_usage(["x" * 30, "x" * 10], tokens_used=100, duration=2.0)
+    assert usage == [(75, 1.5), (25, 0.5)]
+
+    even = _split_batch_usage(["", ""], tokens_used=10, duration=1.0)
+    assert even == [(5, 0.5), (5, 0.5)]
+
+
+def test_batched_run_splits_usage(make_validator: Callable[[str], LearningValidator]) -> None:
+    """Verify a parsed batch records one call per task with split durations."""
+    validator = make_validator(json.dumps(["aaa", "b"]))
+
+    result = validator.run_scenario_batched(["t1", "t2"], batch_size=2, unbatched_every=0)
+
+    assert result.success
+    assert result.total_calls == 2
+    assert validator._llm.prompts == [_batch_prompt(["t1", "t2"])]
+    assert validator.metrics.total_tokens == 100
+    assert validator.metrics.quality_scores == [0.9, 0.9]
+
+
+def test_batched_run_falls_back_on_bad_response(
+    make_validator: Callable[[str], LearningValidator],
+) -> None:
+    """Verify an unparseable batch response falls back to individual calls.
+
+    The discarded batch request was still billed, so its tokens count too.
+    """
+    validator = make_validator("I cannot answer in JSON.")
+
+    result = validator.run_scenario_batched(["t1", "t2"], batch_size=2, unbatched_every=0)
+
+    assert result.success
+    assert result.total_calls == 2
+    assert validator._llm.prompts[1:] == ["t1", "t2"]
+    assert validator.metrics.total_tokens == 100 + 10 + 10
+    assert validator.metrics.cost_usd == pytest.approx(cost_for_tokens(120))
+    assert validator.metrics.quality_scores == [0.8, 0.8]
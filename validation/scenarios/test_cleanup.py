@@ -0,0 +1,89 @@
+"""Memory directory cleanup checks.
+
+Exercises _fast_rmtree on temporary trees. No LLM calls; runs without
+netanel-core.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import validation.validator as validator_module
+from validation.validator import _fast_rmtree
+
+
+def test_fast_rmtree_removes_nested_tree(tmp_path: Path) -> None:
+    """Verify every file and directory under the root is deleted."""
+    root = tmp_path / "memories"
+    for ns in range(3):
+        patterns = root / f"ns{ns}" / "patterns"
+        patterns.mkdir(parents=True)
+        for n in range(20):
+            (patterns / f"p{n}.md").write_text("pattern", encoding="utf-8")
+    (root / "empty").mkdir()
+
+    _fast_rmtree(root, max_workers=4)
+
+    assert not root.exists()
+
+
+def test_fast_rmtree_does_not_follow_symlinks(tmp_path: Path) -> None:
+    """Verify symlinked directories are unlinked, not emptied."""
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "keep.md").write_text("keep", encoding="utf-8")
+
+    root = tmp_path / "memories"
+    root.mkdir()
+    try:
+        (root / "link").symlink_to(outside, target_is_directory=True)
+    except OSError:
+        pytest.skip("Symlinks not supported")
+
+    _fast_rmtree(root)
+
+    assert not root.exists()
+    assert (outside / "keep.md").is_file()
+
+
+def test_fast_rmtree_missing_path(tmp_path: Path) -> None:
+    """Verify a missing directory is a no-op."""
+    _fast_rmtree(tmp_path / "missing")
+
+
+def test_fast_rmtree_refuses_symlinked_root(tmp_path: Path) -> None:
+    """Verify a symlinked root is rejected without touching its target."""
+    target = tmp_path / "target"
+    target.mkdir()
+    (target / "keep.md").write_text("keep", encoding="utf-8")
+
+    link = tmp_path / "memories"
+    try:
+        link.symlink_to(target, target_is_directory=True)
+    except OSError:
+        pytest.skip("Symlinks not supported")
+
+    with pytest.raises(OSError):
+        _fast_rmtree(link)
+
+    assert (target / "keep.md").is_file()
+
+
+def test_fast_rmtree_propagates_unlink_errors(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Verify unlink errors other than a missing file are not swallowed."""
+    root = tmp_path / "memories"
+    root.mkdir()
+    (root / "locked.md").write_text("locked", encoding="utf-8")
+
+    def denied(path: str) -> None:
+        raise PermissionError(path)
+
+    monkeypatch.setattr(validator_module, "_unlink", denied)
+
+    with pytest.raises(PermissionError):
+        _fast_rmtree(root)
@@ -0,0 +1,175 @@
+"""Concurrent scenario execution checks.
+
+Covers LearningValidator.run_scenario's concurrent pipeline: budget
+enforcement (serialized and thread-safe modes), recording of in-flight
+calls, and failure logging. A scripted stand-in for LearningLLM is used,
+so no LLM calls are made and netanel-core is not required.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+import validation.validator as validator_module
+from validation.config import ValidationConfig
+from validation.metrics import cost_for_tokens
+from validation.validator import LearningValidator
+
+# Tokens per scripted call: $0.075 each at the estimated gpt-4o-mini price
+TOKENS_PER_CALL = 200_000
+
+
+class ScriptedLLM:
+    """LearningLLM stand-in: fixed-cost answers, failing on "fail" tasks."""
+
+    def __init__(self, delay_s: float = 0.0) -> None:
+        self.delay_s = delay_s
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def call(self, task: str) -> SimpleNamespace:
+        with self._lock:
+            self.calls += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay_s)
+            if "fail" in task:
+                raise RuntimeError(f"scripted failure for {task}")
+            return SimpleNamespace(
+                response=f"answer to {task}", score=0.9, tokens_used=TOKENS_PER_CALL
+            )
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+@pytest.fixture
+def make_validator(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    config: ValidationConfig,
+) -> Callable[..., LearningValidator]:
+    """Build a LearningValidator driven by a ScriptedLLM, saving call logs."""
+    monkeypatch.setattr(validator_module, "NETANEL_CORE_AVAILABLE", True)
+
+    def make(delay_s: float = 0.0, **overrides: Any) -> LearningValidator:
+        update = {"cache_enabled": False, "max_concurrency": 4, **overrides}
+        validator = LearningValidator(
+            namespace="test-concurrency",
+            memories_dir=tmp_path / "memories",
+            config=config.model_copy(update=update),
+            artifacts_dir=tmp_path / "artifacts",
+        )
+        validator._llm = ScriptedLLM(delay_s)
+        return validator
+
+    return make
+
+
+def _call_log(validator: LearningValidator) -> list[dict[str, Any]]:
+    """Read the validator's calls.jsonl entries, ordered by call index."""
+    validator.artifacts.close()
+    lines = (validator.artifacts.artifacts_dir / "calls.jsonl").read_text().splitlines()
+    return sorted((json.loads(line) for line in lines), key=lambda e: e["call_index"])
+
+
+def test_serialized_budget_overshoot(make_validator: Callable[..., LearningValidator]) -> None:
+    """Verify serialized calls overshoot the budget by at most one call."""
+    validator = make_validator(delay_s=0.01, max_cost_usd=0.25)
+    tasks = [f"task {i}" for i in range(10)]
+
+    result = validator.run_scenario(tasks)
+
+    per_call = cost_for_tokens(TOKENS_PER_CALL)
+    assert not result.success
+    assert validator._llm.peak == 1, "LearningLLM calls were not serialized"
+    assert result.total_calls == validator._llm.calls == 4
+    assert result.estimated_cost_usd < 0.25 + per_call
+
+    log = _call_log(validator)
+    assert [e["call_index"] for e in log] == list(range(len(tasks)))
+    assert sum(e["success"] for e in log) == 4
+    assert all(e["error"] == "budget" for e in log if not e["success"])
+
+
+def test_thread_safe_records_in_flight_calls(
+    make_validator: Callable[..., LearningValidator],
+) -> None:
+    """Verify calls in flight when the budget trips are recorded and costed."""
+    validator = make_validator(delay_s=0.05, max_cost_usd=0.1, llm_thread_safe=True)
+    tasks = [f"task {i}" for i in range(12)]
+
+    result = validator.run_scenario(tasks)
+
+    llm = validator._llm
+    assert not result.success
+    assert llm.peak > 1, "Calls did not overlap"
+    assert result.total_calls == llm.calls
+    assert validator.metrics.cost_usd == pytest.approx(cost_for_tokens(llm.calls * TOKENS_PER_CALL))
+
+    log = _call_log(validator)
+    assert sum(e["success"] for e in log) == llm.calls
+    assert sum(e.get("error") == "budget" for e in log) == len(tasks) - llm.calls
+
+
+def test_failed_call_is_logged(make_validator: Callable[..., LearningValidator]) -> None:
+    """Verify a failing call is logged as failed and the run continues."""
+    validator = make_validator()
+    tasks = ["task 0", "fail 1", "task 2"]
+
+    result = validator.run_scenario(tasks)
+
+    assert result.success
+    assert validator.metrics.total_calls == 2
+
+    log = _call_log(validator)
+    assert [e["success"] for e in log] == [True, False, True]
+    assert "scripted failure" in log[1]["error"]
+
+
+def test_recording_failure_is_logged(
+    make_validator: Callable[..., LearningValidator],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Verify an error while recording a call is logged, not silently dropped."""
+    validator = make_validator()
+
+    def broken_record_call(**kwargs: Any) -> None:
+        raise ValueError("metrics unavailable")
+
+    monkeypatch.setattr(validator.metrics, "record_call", broken_record_call)
+
+    validator.run_scenario(["task 0"])
+
+    log = _call_log(validator)
+    assert len(log) == 1
+    assert not log[0]["success"]
+    assert log[0]["error"] == "metrics unavailable"
+
+
+def test_cache_write_failure_keeps_call(
+    make_validator: Callable[..., LearningValidator],
+    tmp_path: Path,
+) -> None:
+    """Verify a failed cache write still records the (billed) call."""
+    not_a_dir = tmp_path / "cache-file"
+    not_a_dir.write_text("", encoding="utf-8")
+    validator = make_validator(cache_enabled=True, cache_dir=str(not_a_dir))
+    validator._cache = validator_module.FileLLMCache(not_a_dir)
+
+    result = validator.run_scenario(["task 0"])
+
+    assert result.success
+    assert validator.metrics.cost_usd == pytest.approx(cost_for_tokens(TOKENS_PER_CALL))
+    assert _call_log(validator)[0]["success"]
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from validation import (
@@ -82,7 +83,9 @@ def test_full_loop_with_evolution(
     )
 
     # Verify quality maintained
-    all_scores = validator1.metrics.quality_scores + validator2.metrics.quality_scores
+    all_scores = np.concatenate(
+        [validator1.metrics.quality_scores, validator2.metrics.quality_scores]
+    )
     assert_quality_threshold(all_scores, min_threshold=config.quality_threshold)
 
     # Verify budget
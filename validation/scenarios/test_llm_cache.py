@@ -0,0 +1,84 @@
+"""LLM response cache checks.
+
+Exercises FileLLMCache on a temporary directory. No LLM calls; runs
+without netanel-core.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+from validation.llm_cache import FileLLMCache, normalize_prompt
+
+
+def test_cache_round_trip(tmp_path: Path) -> None:
+    """Verify a stored result is returned and laid out under a 2-char prefix dir."""
+    cache = FileLLMCache(tmp_path)
+    key = FileLLMCache.make_key("gpt-4o-mini", "Reverse a string.", "v1")
+
+    assert cache.get(key) is None
+
+    cache.set(key, {"response": "def reverse(s): ...", "score": 0.9})
+
+    assert cache.get(key) == {"response": "def reverse(s): ...", "score": 0.9}
+    assert (tmp_path / key[:2] / f"{key}.json").is_file()
+    assert not list(tmp_path.rglob("*.tmp")), "Temp file left behind"
+
+
+def test_cache_key_scope() -> None:
+    """Verify keys differ by model, prompt version and task."""
+    key = FileLLMCache.make_key("gpt-4o-mini", "Reverse a string.", "v1")
+
+    assert len(key) == 64
+    assert key != FileLLMCache.make_key("gpt-4o", "Reverse a string.", "v1")
+    assert key != FileLLMCache.make_key("gpt-4o-mini", "Reverse a string.", "v2")
+    assert key != FileLLMCache.make_key("gpt-4o-mini", "Sort a list.", "v1")
+
+
+def test_cache_expired_entry_is_miss(tmp_path: Path) -> None:
+    """Verify entries older than the TTL are ignored."""
+    cache = FileLLMCache(tmp_path, ttl_seconds=60)
+    key = FileLLMCache.make_key("gpt-4o-mini", "Reverse a string.", "")
+    cache.set(key, {"response": "r", "score": 0.9})
+
+    path = tmp_path / key[:2] / f"{key}.json"
+    entry = json.loads(path.read_text(encoding="utf-8"))
+    entry["cached_at"] = time.time() - 120
+    path.write_text(json.dumps(entry), encoding="utf-8")
+
+    assert cache.get(key) is None
+
+
+def test_cache_corrupt_entry_is_miss(tmp_path: Path) -> None:
+    """Verify unreadable entries are treated as misses."""
+    cache = FileLLMCache(tmp_path)
+    key = FileLLMCache.make_key("gpt-4o-mini", "Reverse a string.", "")
+
+    path = tmp_path / key[:2] / f"{key}.json"
+    path.parent.mkdir(parents=True)
+    path.write_text("{truncated", encoding="utf-8")
+
+    assert cache.get(key) is None
+
+
+def test_normalize_prompt() -> None:
+    """Verify whitespace and trailing punctuation are normalized away, case is kept."""
+    assert normalize_prompt("  Reverse   a\nString!  ") == "Reverse a String"
+    assert normalize_prompt("Sort a list?!") == "Sort a list"
+    assert normalize_prompt("Use a.b notation") == "Use a.b notation"
+
+
+def test_normalized_prompts_share_key() -> None:
+    """Verify prompts differing only in normalization share one cache key."""
+    key = FileLLMCache.make_key("gpt-4o-mini", "Reverse a string.", "v1")
+
+    assert key == FileLLMCache.make_key("gpt-4o-mini", "Reverse  a\nstring", "v1")
+
+
+def test_case_sensitive_prompts_get_distinct_keys() -> None:
+    """Verify prompts differing in case (e.g. identifiers) do not share an entry."""
+    key = FileLLMCache.make_key("gpt-4o-mini", "Define a class Node.", "v1")
+
+    assert key != FileLLMCache.make_key("gpt-4o-mini", "Define a class node.", "v1")
@@ -0,0 +1,95 @@
+"""Metrics collection checks.
+
+Exercises MetricsCollector directly. No LLM calls; runs without
+netanel-core.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+from validation.metrics import DirListingCache, MemorySnapshot, MetricsCollector
+
+
+def _age(root: Path) -> None:
+    """Backdate every directory's mtime so its listing is cacheable."""
+    old = time.time() - 3600
+    for path in [root, *root.rglob("*")]:
+        if path.is_dir():
+            os.utime(path, (old, old))
+
+
+def _memories(tmp_path: Path) -> Path:
+    """Build a small netanel-core-style memories tree."""
+    root = tmp_path / "memories"
+    (root / "ns" / "patterns").mkdir(parents=True)
+    (root / "ns" / "prompts").mkdir()
+    (root / "ns" / "patterns" / "p1.md").write_text("pattern", encoding="utf-8")
+    (root / "ns" / "prompts" / "v1.md").write_text("prompt", encoding="utf-8")
+    (root / "ns" / "state.json").write_text("{}", encoding="utf-8")
+    _age(root)
+    return root
+
+
+def test_cache_hits_excluded_from_latency() -> None:
+    """Verify cached calls count toward totals but not latency statistics."""
+    metrics = MetricsCollector()
+    metrics.record_call(duration_s=2.0, quality_score=0.8, tokens_used=100)
+    metrics.record_call(duration_s=0.001, quality_score=0.9, tokens_used=0, cached=True)
+
+    exported = metrics.export()
+
+    assert exported["total_calls"] == 2
+    assert exported["cache_hits"] == 1
+    assert exported["latency"]["min_s"] == 2.0
+    assert exported["latency"]["p50_s"] == 2.0
+    assert metrics.call_durations == [2.0]
+    assert metrics.quality_scores == [0.8, 0.9]
+
+
+def test_capture_counts_patterns_and_evolutions(tmp_path: Path) -> None:
+    """Verify files, sizes, patterns and evolved prompts are counted."""
+    snapshot = MemorySnapshot.capture(_memories(tmp_path))
+
+    assert snapshot.total_files == 3
+    assert snapshot.total_size_bytes == len("pattern") + len("prompt") + len("{}")
+    assert snapshot.pattern_count == 1
+    assert snapshot.evolution_count == 1
+
+
+def test_listing_cache_reused_for_unchanged_dirs(tmp_path: Path) -> None:
+    """Verify unchanged directories are served from the listing cache."""
+    root = _memories(tmp_path)
+    listing_cache: DirListingCache = {}
+
+    first = MemorySnapshot.capture(root, listing_cache)
+    assert set(listing_cache) == {
+        os.fspath(root),
+        os.fspath(root / "ns"),
+        os.fspath(root / "ns" / "patterns"),
+        os.fspath(root / "ns" / "prompts"),
+    }
+    listings = dict(listing_cache)
+
+    # File sizes are re-stat'ed even when the listing is cached
+    (root / "ns" / "state.json").write_text('{"calls": 1}', encoding="utf-8")
+    second = MemorySnapshot.capture(root, listing_cache)
+
+    assert all(listing_cache[path] is listings[path] for path in listings), "Dir re-listed"
+    assert second.total_files == first.total_files
+    assert second.total_size_bytes == first.total_size_bytes + len('{"calls": 1}') - len("{}")
+
+
+def test_snapshot_sees_nested_changes(tmp_path: Path) -> None:
+    """Verify files added in nested dirs are counted without a recorded call."""
+    root = _memories(tmp_path)
+    metrics = MetricsCollector()
+
+    before = metrics.snapshot_memory(root)
+    (root / "ns" / "patterns" / "p2.md").write_text("new pattern", encoding="utf-8")
+    after = metrics.snapshot_memory(root)
+
+    assert after.pattern_count == before.pattern_count + 1
+    assert after.total_files == before.total_files + 1
@@ -0,0 +1,17 @@
+"""Task dataset checks.
+
+Static checks on the coding task dataset used by all scenarios.
+No LLM calls; runs without netanel-core.
+"""
+
+from __future__ import annotations
+
+from validation.tasks import CODING_TASKS
+
+
+def test_coding_tasks_dataset() -> None:
+    """Verify the dataset has enough unique, non-empty tasks for every scenario."""
+    assert isinstance(CODING_TASKS, tuple), "CODING_TASKS must be immutable"
+    assert len(CODING_TASKS) >= 50, f"Expected >= 50 tasks, got {len(CODING_TASKS)}"
+    assert all(task.strip() for task in CODING_TASKS), "Empty task in CODING_TASKS"
+    assert len(set(CODING_TASKS)) == len(CODING_TASKS), "Duplicate task in CODING_TASKS"
@@ -1,5 +1,5 @@
 """Task datasets for validation scenarios."""
 
-from validation.tasks.code_generation import CODING_TASKS
+from validation.tasks.code_generation import CODING_TASKS, token_count_for
 
-__all__ = ["CODING_TASKS"]
+__all__ = ["CODING_TASKS", "token_count_for"]
@@ -4,7 +4,28 @@
 Used to test netanel-core's learning algorithm with real-world tasks.
 """
 
-CODING_TASKS = [
+from __future__ import annotations
+
+import functools
+
+# tiktoken is optional (exact token counts); without it counts are estimated
+try:
+    import tiktoken
+
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+# gpt-4o-mini tokenizer
+_ENCODING_NAME = "o200k_base"
+
+# Rough English average, used when tiktoken is not installed
+_CHARS_PER_TOKEN = 4
+
+# Prompts whose token counts are memoized (the dataset plus recent batched prompts)
+_TOKEN_COUNT_CACHE_SIZE = 256
+
+CODING_TASKS: tuple[str, ...] = (
     # Easy tasks (10)
     "Write a Python function that checks if a number is prime.",
     "Create a function to reverse a string without using built-in reverse methods.",
@@ -65,7 +86,40 @@ CODING_TASKS = [
     "Implement a function to detect outliers using IQR method.",
     "Write a function to calculate correlation between two datasets.",
     "Create a function to perform one-hot encoding on categorical data.",
-]
+)
+
+
+@functools.cache
+def _encoding() -> tiktoken.Encoding | None:
+    """Load the tokenizer once per process.
+
+    Returns:
+        The encoding, or None if tiktoken is not installed or the encoding
+        cannot be loaded (e.g. its BPE file cannot be downloaded on first use).
+    """
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return tiktoken.get_encoding(_ENCODING_NAME)
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=_TOKEN_COUNT_CACHE_SIZE)
+def token_count_for(task: str) -> int:
+    """Count the prompt tokens of a task.
+
+    Memoized in a bounded LRU cache keyed by prompt string. The dataset's
+    tasks stay cached across scenarios, while one-off prompts (e.g.
+    batched prompts) are evicted instead of accumulating.
+
+    Args:
+        task: Task string sent to the LLM.
 
-# Verify we have 50+ tasks
-assert len(CODING_TASKS) >= 50, f"Expected >= 50 tasks, got {len(CODING_TASKS)}"
+    Returns:
+        Token count (estimated from length if the tokenizer is unavailable).
+    """
+    encoding = _encoding()
+    if encoding is not None:
+        return len(encoding.encode(task))
+    return -(-len(task) // _CHARS_PER_TOKEN)
@@ -2,7 +2,7 @@
 
 Main component that orchestrates validation runs:
 - Initializes netanel-core LearningLLM
-- Executes tasks sequentially
+- Executes tasks concurrently (bounded)
 - Collects metrics
 - Enforces configuration bounds
 - Returns validation results
@@ -10,20 +10,31 @@ Main component that orchestrates validation runs:
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import hashlib
+import json
 import logging
+import os
+import shutil
 import sys
 import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
 
 from validation.artifacts import ArtifactManager
 from validation.config import ValidationConfig
-from validation.metrics import MetricsCollector
+from validation.llm_cache import FileLLMCache
+from validation.metrics import MetricsCollector, cost_for_tokens
+from validation.tasks import token_count_for
 
 # netanel-core is optional for this module (only needed at runtime)
 try:
-    from netanel_core import CallResult, LearningLLM, MemoryStore, NathanConfig
+    from netanel_core import CallResult, LearningLLM, NathanConfig
     from netanel_core.config import EvalConfig, ModelConfig, SafetyBounds
 
     NETANEL_CORE_AVAILABLE = True
@@ -32,11 +43,125 @@ except ImportError:
     # Type hints for when netanel-core is not installed
     CallResult = Any
     LearningLLM = Any
-    MemoryStore = Any
     NathanConfig = Any
 
 logger = logging.getLogger(__name__)
 
+MODEL = "gpt-4o-mini"
+
+
+def _unlink(path: str) -> None:
+    """Remove a file, ignoring files that are already gone."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _fast_rmtree(path: Path, max_workers: int = 16) -> None:
+    """Delete a directory tree, unlinking files in parallel.
+
+    Files are collected with an os.scandir walk and unlinked from a thread
+    pool (the GIL is released during the syscalls); directories are then
+    removed bottom-up. Anything left behind (e.g. files created during the
+    walk) is handed to shutil.rmtree.
+
+    Unlink errors other than FileNotFoundError propagate. A symlinked root
+    is passed straight to shutil.rmtree, which refuses it, so the link
+    target is never walked.
+    """
+    if path.is_symlink():
+        shutil.rmtree(path)
+        return
+
+    files: list[str] = []
+    dirs: list[str] = []
+    stack = [os.fspath(path)]
+    while stack:
+        current = stack.pop()
+        dirs.append(current)
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        files.append(entry.path)
+        except FileNotFoundError:
+            continue
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        # Consume the results so unlink errors are raised here
+        list(pool.map(_unlink, files))
+
+    # Children are always listed after their parent, so reverse order is bottom-up
+    for directory in reversed(dirs):
+        try:
+            os.rmdir(directory)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            break
+
+    if path.exists():
+        shutil.rmtree(path)
+
+
+def _truncate(text: str, limit: int = 200) -> str:
+    """Truncate text for artifacts, skipping the slice copy when already short."""
+    return text if len(text) <= limit else text[:limit]
+
+
+def _batch_prompt(tasks: Sequence[str]) -> str:
+    """Row-marshal several tasks into a single prompt."""
+    numbered = "\n".join(f"{n}. {task}" for n, task in enumerate(tasks, start=1))
+    return (
+        "Return a JSON list of answers (one string per task, in order) "
+        f"for the following tasks:\n{numbered}"
+    )
+
+
+def _parse_batch_answers(response: str, expected: int) -> list[str] | None:
+    """Extract the JSON list of answers from a batched response.
+
+    Returns:
+        List of answers, or None if the response is not a list of the
+        expected length.
+    """
+    start, end = response.find("["), response.rfind("]")
+    if start == -1 or end <= start:
+        return None
+
+    try:
+        answers = json.loads(response[start : end + 1])
+    except ValueError:
+        return None
+
+    if not isinstance(answers, list) or len(answers) != expected:
+        return None
+    return [a if isinstance(a, str) else json.dumps(a) for a in answers]
+
+
+def _split_batch_usage(
+    answers: Sequence[str],
+    tokens_used: int,
+    duration: float,
+) -> list[tuple[int, float]]:
+    """Attribute a batched request's tokens and duration to its answers.
+
+    Both are split in proportion to answer length, so per-task latency
+    samples stay comparable with single calls and sum to the request's.
+
+    Returns:
+        (tokens, duration) per answer, in order.
+    """
+    total_chars = sum(len(a) for a in answers)
+    if total_chars == 0:
+        weights = [1 / len(answers)] * len(answers)
+    else:
+        weights = [len(a) / total_chars for a in answers]
+    return [(round(tokens_used * w), duration * w) for w in weights]
+
 
 @dataclass
 class ValidationResult:
@@ -89,11 +214,11 @@ class LearningValidator:
         self.memories_dir = memories_dir
         self.config = config
 
-        self.metrics = MetricsCollector()
+        self.metrics = MetricsCollector(reservoir_size=config.reservoir_size)
         self.artifacts = ArtifactManager(artifacts_dir)
 
         self._llm: LearningLLM | None = None
-        self._store: MemoryStore | None = None
+        self._cache: FileLLMCache | None = None
 
     def setup(self) -> None:
         """Setup LearningLLM instance.
@@ -104,9 +229,9 @@ class LearningValidator:
             namespace=self.namespace,
             memories_dir=self.memories_dir,
             models=ModelConfig(
-                primary_model="gpt-4o-mini",
-                evaluator_model="gpt-4o-mini",
-                extractor_model="gpt-4o-mini",
+                primary_model=MODEL,
+                evaluator_model=MODEL,
+                extractor_model=MODEL,
             ),
             safety=SafetyBounds(
                 quality_threshold=self.config.quality_threshold,
@@ -118,9 +243,13 @@ class LearningValidator:
 
         nathan_config.ensure_directories()
 
-        self._store = MemoryStore(nathan_config)
+        # LearningLLM loads its own memory store; building a separate
+        # MemoryStore here would scan the memory files a second time
         self._llm = LearningLLM(nathan_config)
 
+        if self.config.cache_enabled:
+            self._cache = FileLLMCache(Path(self.config.cache_dir))
+
         # Capture initial memory snapshot
         self.metrics.snapshot_memory(self.memories_dir)
 
@@ -128,13 +257,17 @@ class LearningValidator:
 
     def run_scenario(
         self,
-        tasks: list[str],
+        tasks: Sequence[str],
         max_calls: int | None = None,
     ) -> ValidationResult:
         """Execute validation scenario.
 
+        Tasks are submitted concurrently, up to config.max_concurrency at a
+        time; LearningLLM calls are serialized unless config.llm_thread_safe
+        is set. Must not be called from a running event loop.
+
         Args:
-            tasks: List of task strings to execute.
+            tasks: Task strings to execute.
             max_calls: Optional max number of calls (overrides len(tasks)).
 
         Returns:
@@ -146,67 +279,194 @@ class LearningValidator:
         if max_calls is not None:
             tasks = tasks[:max_calls]
 
-        logger.info("Starting validation with %d tasks", len(tasks))
-
-        call_results = []
-
-        for i, task in enumerate(tasks):
-            # Check cost budget before call
-            current_cost = self.metrics._estimate_cost()
-            if current_cost >= self.config.max_cost_usd:
-                error_msg = f"Cost budget exceeded: ${current_cost:.2f} >= ${self.config.max_cost_usd:.2f}"
-                logger.error(error_msg)
-                return ValidationResult(
-                    success=False,
-                    total_calls=i,
-                    total_tokens=self.metrics.total_tokens,
-                    estimated_cost_usd=current_cost,
-                    metrics=self.metrics.export(),
-                    error=error_msg,
-                )
+        logger.info(
+            "Starting validation with %d tasks (concurrency %d)",
+            len(tasks),
+            self.config.max_concurrency,
+        )
 
-            # Execute LLM call
-            try:
-                start_time = time.time()
-                result = self._llm.call(task)
-                duration = time.time() - start_time
-
-                # Record metrics
-                self.metrics.record_call(
-                    duration_s=duration,
-                    quality_score=result.score,
-                    tokens_used=getattr(result, "tokens_used", 0),  # If available
-                )
+        # Preallocated so concurrent calls record results by task index
+        call_results: list[dict[str, Any] | None] = [None] * len(tasks)
 
-                # Save call log
-                call_data = {
-                    "task": task,
-                    "response": result.response[:200],  # Truncate for artifacts
-                    "quality_score": result.score,
-                    "duration_s": duration,
-                    "success": True,
-                }
-                self.artifacts.save_log(i, call_data)
+        budget_error = asyncio.run(self._run_calls(tasks, call_results))
+        if budget_error is not None:
+            completed = sum(r is not None and r.get("error") != "budget" for r in call_results)
+            return self._budget_failure(completed, budget_error)
 
-                call_results.append(call_data)
+        return self._finish(len(tasks))
 
-                logger.info(
-                    "Call %d/%d: score=%.3f, duration=%.2fs",
-                    i + 1,
-                    len(tasks),
-                    result.score,
-                    duration,
-                )
+    def run_scenario_batched(
+        self,
+        tasks: Sequence[str],
+        batch_size: int | None = None,
+        unbatched_every: int = 3,
+    ) -> ValidationResult:
+        """Execute validation scenario with several tasks per LLM request.
+
+        Tasks are row-marshaled into one prompt asking for a JSON list of
+        answers, cutting request count by ~batch_size under provider rate
+        limits. Every unbatched_every-th group is still sent as individual
+        calls so LearningLLM keeps getting per-task feedback for learning
+        and evolution. Groups whose response cannot be parsed also fall
+        back to individual calls.
+
+        LearningLLM scores a request as a whole, so every task in a batch
+        gets the batch score; tokens and duration are split by answer length.
+
+        Args:
+            tasks: Task strings to execute.
+            batch_size: Tasks per request (defaults to config.row_marshal_batch_size).
+            unbatched_every: Send every Nth group unbatched (0 disables).
+
+        Returns:
+            ValidationResult with success status and metrics.
+        """
+        if self._llm is None:
+            self.setup()
+
+        batch_size = batch_size or self.config.row_marshal_batch_size
+        groups = [tasks[i : i + batch_size] for i in range(0, len(tasks), batch_size)]
+
+        logger.info(
+            "Starting batched validation with %d tasks in %d groups",
+            len(tasks),
+            len(groups),
+        )
 
-            except Exception as e:
-                logger.error("Call %d failed: %s", i, e)
-                call_data = {
-                    "task": task,
-                    "error": str(e),
-                    "success": False,
-                }
-                call_results.append(call_data)
-                self.artifacts.save_log(i, call_data)
+        completed = 0
+        for group_index, group in enumerate(groups):
+            answers: list[str] | None = None
+            unbatched = unbatched_every and (group_index + 1) % unbatched_every == 0
+            if not unbatched and len(group) > 1:
+                # Check cost budget (including the batched prompt) before call
+                prompt = _batch_prompt(group)
+                if budget_error := self._check_budget(prompt):
+                    return self._budget_failure(completed, budget_error)
+
+                result = None
+                try:
+                    start_time = time.time()
+                    result = self._llm.call(prompt)
+                    duration = time.time() - start_time
+                    answers = _parse_batch_answers(result.response, len(group))
+                except Exception as e:
+                    logger.error("Batched call for group %d failed: %s", group_index, e)
+
+                if answers is None:
+                    # An unparseable batch response was still billed
+                    if result is not None:
+                        self.metrics.add_tokens(getattr(result, "tokens_used", 0))
+                    logger.warning("Group %d falling back to individual calls", group_index)
+
+            if answers is not None:
+                usage = _split_batch_usage(answers, getattr(result, "tokens_used", 0), duration)
+                for task, answer, (tokens_used, task_duration) in zip(group, answers, usage):
+                    self._record_call(
+                        completed,
+                        task,
+                        response=answer,
+                        score=result.score,
+                        duration=task_duration,
+                        tokens_used=tokens_used,
+                    )
+                    completed += 1
+                continue
+
+            for task in group:
+                if budget_error := self._check_budget(task):
+                    return self._budget_failure(completed, budget_error)
+
+                try:
+                    start_time = time.time()
+                    result = self._llm.call(task)
+                    duration = time.time() - start_time
+                    self._record_call(
+                        completed,
+                        task,
+                        response=result.response,
+                        score=result.score,
+                        duration=duration,
+                        tokens_used=getattr(result, "tokens_used", 0),
+                    )
+                except Exception as e:
+                    logger.error("Call %d failed: %s", completed, e)
+                    self.artifacts.save_log(
+                        completed, {"task": task, "error": str(e), "success": False}
+                    )
+                completed += 1
+
+        return self._finish(len(tasks))
+
+    def _check_budget(self, task: str | None = None) -> str | None:
+        """Check the cost budget.
+
+        Args:
+            task: Optional task about to be sent. Its prompt tokens are
+                priced in, so a call that would cross the budget is never
+                issued.
+
+        Returns:
+            Error message if the budget is exhausted, else None.
+        """
+        current_cost = self.metrics.cost_usd
+        if task is not None:
+            current_cost += cost_for_tokens(token_count_for(task))
+        if current_cost < self.config.max_cost_usd:
+            return None
+
+        error_msg = f"Cost budget exceeded: ${current_cost:.2f} >= ${self.config.max_cost_usd:.2f}"
+        logger.error(error_msg)
+        return error_msg
+
+    def _record_call(
+        self,
+        call_index: int,
+        task: str,
+        response: str,
+        score: float,
+        duration: float,
+        tokens_used: int,
+        cached: bool = False,
+    ) -> dict[str, Any]:
+        """Record metrics and the call log for a successful call.
+
+        Returns:
+            Call data dict as written to the call log.
+        """
+        self.metrics.record_call(
+            duration_s=duration,
+            quality_score=score,
+            tokens_used=tokens_used,
+            cached=cached,
+        )
+
+        call_data = {
+            "task": task,
+            "response": _truncate(response) if self.config.verbose_logs else None,
+            "quality_score": score,
+            "duration_s": duration,
+            "cached": cached,
+            "success": True,
+        }
+        self.artifacts.save_log(call_index, call_data)
+        return call_data
+
+    def _budget_failure(self, total_calls: int, error: str) -> ValidationResult:
+        """Build the result for a run stopped by the cost budget."""
+        self.artifacts.flush_logs()
+        return ValidationResult(
+            success=False,
+            total_calls=total_calls,
+            total_tokens=self.metrics.total_tokens,
+            estimated_cost_usd=self.metrics.cost_usd,
+            metrics=self.metrics.export(),
+            error=error,
+        )
+
+    def _finish(self, total_calls: int) -> ValidationResult:
+        """Write final artifacts and build the result for a completed run."""
+        # Write any buffered call logs
+        self.artifacts.flush_logs()
 
         # Capture final memory snapshot
         final_snapshot = self.metrics.snapshot_memory(self.memories_dir)
@@ -222,22 +482,221 @@ class LearningValidator:
 
         return ValidationResult(
             success=True,
-            total_calls=len(tasks),
+            total_calls=total_calls,
             total_tokens=self.metrics.total_tokens,
-            estimated_cost_usd=self.metrics._estimate_cost(),
+            estimated_cost_usd=self.metrics.cost_usd,
             metrics=metrics_export,
         )
 
+    async def _call_async(self, task: str) -> CallResult:
+        """Execute one LLM call without blocking the event loop.
+
+        Uses LearningLLM.acall() when available, otherwise runs the
+        blocking call() in a worker thread.
+
+        Args:
+            task: Task string to send.
+
+        Returns:
+            CallResult from LearningLLM.
+        """
+        acall = getattr(self._llm, "acall", None)
+        if acall is not None:
+            return await acall(task)
+        return await asyncio.to_thread(self._llm.call, task)
+
+    async def _call_cached(self, task: str, prompt_version: str) -> tuple[Any, bool]:
+        """Execute one LLM call, serving it from the response cache when possible.
+
+        Args:
+            task: Task string to send.
+            prompt_version: Current evolved-prompt identifier (part of the cache key).
+
+        Returns:
+            Tuple of (result, cache hit). Cached results carry no token cost.
+            Cache write errors are logged and otherwise ignored.
+        """
+        if self._cache is None:
+            return await self._call_async(task), False
+
+        key = FileLLMCache.make_key(MODEL, task, prompt_version)
+        if (cached := self._cache.get(key)) is not None:
+            return SimpleNamespace(**cached, tokens_used=0), True
+
+        result = await self._call_async(task)
+
+        # Best-effort: the call is already billed, so a failed cache write
+        # must not turn it into a failed (and uncosted) call
+        try:
+            self._cache.set(
+                key,
+                {
+                    "response": result.response,
+                    "score": result.score,
+                },
+            )
+        except OSError as e:
+            logger.warning("Could not write LLM cache entry: %s", e)
+        return result, False
+
+    def _prompt_version(self) -> str:
+        """Identify the current evolved prompts by hashing their contents.
+
+        Returns:
+            Short hex digest ("" when no evolved prompts exist yet).
+        """
+        prompt_files = sorted(self.memories_dir.glob("**/prompts/*.md"))
+        if not prompt_files:
+            return ""
+
+        digest = hashlib.sha256()
+        for path in prompt_files:
+            digest.update(path.read_bytes())
+        return digest.hexdigest()[:16]
+
+    async def _run_calls(
+        self,
+        tasks: Sequence[str],
+        call_results: list[dict[str, Any] | None],
+    ) -> str | None:
+        """Execute tasks concurrently, bounded by config.max_concurrency.
+
+        All (independent) task calls are submitted up front as tasks, and
+        metrics and call logs are recorded in completion order. Unless
+        config.llm_thread_safe is set, calls into the shared LearningLLM
+        are serialized by a lock (cache hits included).
+
+        Each call checks the budget before it starts and is recorded before
+        the next serialized call may start, so the budget is overshot by at
+        most the calls in flight: one when serialized, max_concurrency
+        otherwise. Once the budget is reached, calls that have not started
+        are cancelled and logged with error "budget". Calls already in
+        flight cannot be stopped (the request is already sent), so they are
+        awaited and recorded like any other call, keeping their tokens in
+        the reported cost.
+
+        Args:
+            tasks: Task strings to execute.
+            call_results: Preallocated list, filled with call data by task index.
+
+        Returns:
+            Error message if the cost budget was exceeded, else None.
+        """
+        # Size the to_thread() pool to the concurrency limit (asyncio.run shuts it down)
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=self.config.max_concurrency)
+        )
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+
+        # LearningLLM is stateful (memory writes, evolution counters) and not
+        # documented as thread-safe
+        llm_lock = contextlib.nullcontext() if self.config.llm_thread_safe else asyncio.Lock()
+
+        budget_exceeded = asyncio.Event()
+        budget_error: str | None = None
+        started: set[int] = set()
+        prompt_version = self._prompt_version() if self._cache is not None else ""
+
+        # Resolve the log level once per run instead of once per call
+        info_enabled = logger.isEnabledFor(logging.INFO)
+
+        def skip(i: int) -> None:
+            """Log a call that was not made because of the budget."""
+            call_results[i] = {"task": tasks[i], "error": "budget", "success": False}
+            self.artifacts.save_log(i, call_results[i])
+
+        async def submit(i: int, task: str) -> None:
+            """Run one call and record its result."""
+            nonlocal budget_error
+
+            async with semaphore, llm_lock:
+                if budget_exceeded.is_set():
+                    skip(i)
+                    return
+
+                # Check cost budget (including this prompt) before call
+                if error := self._check_budget(task):
+                    budget_error = error
+                    budget_exceeded.set()
+                    skip(i)
+                    return
+
+                started.add(i)
+                start_time = time.time()
+                try:
+                    result, cached = await self._call_cached(task, prompt_version)
+                    duration = time.time() - start_time
+
+                    # Recorded while holding the lock, so the next call's budget
+                    # check includes this call's tokens
+                    call_results[i] = self._record_call(
+                        i,
+                        task,
+                        response=result.response,
+                        score=result.score,
+                        duration=duration,
+                        tokens_used=getattr(result, "tokens_used", 0),  # If available
+                        cached=cached,
+                    )
+                except Exception as e:
+                    logger.error("Call %d failed: %s", i, e)
+                    call_results[i] = {
+                        "task": task,
+                        "error": str(e),
+                        "success": False,
+                    }
+                    self.artifacts.save_log(i, call_results[i])
+                    return
+
+            if info_enabled:
+                logger.info(
+                    "Call %d/%d: score=%.3f, duration=%.2fs",
+                    i + 1,
+                    len(tasks),
+                    result.score,
+                    duration,
+                )
+
+        indices = {asyncio.create_task(submit(i, task)): i for i, task in enumerate(tasks)}
+        pending = set(indices)
+
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+            # Failed calls are logged in submit(); anything else (e.g. call
+            # log I/O errors) is re-raised here instead of being lost
+            for future in done:
+                future.result()
+
+            if budget_error is None:
+                budget_error = self._check_budget()
+
+            if budget_error is not None:
+                budget_exceeded.set()
+
+                # Only cancel calls that have not started; in-flight ones
+                # stay pending and are recorded as they complete
+                waiting = {future for future in pending if indices[future] not in started}
+                for future in waiting:
+                    future.cancel()
+                await asyncio.gather(*waiting, return_exceptions=True)
+                for future in sorted(waiting, key=indices.__getitem__):
+                    skip(indices[future])
+                pending -= waiting
+
+        return budget_error
+
     def cleanup(self) -> None:
         """Cleanup resources.
 
-        Closes LLM connections and optionally cleans up memory directory.
+        Closes the call log, releases the LearningLLM, and optionally
+        cleans up memory directory.
         """
-        if self.config.cleanup_memories and self.memories_dir.exists():
-            import shutil
+        self.artifacts.close()
 
-            shutil.rmtree(self.memories_dir)
+        if self.config.cleanup_memories and self.memories_dir.exists():
+            _fast_rmtree(self.memories_dir)
             logger.info("Cleaned up memory directory: %s", self.memories_dir)
 
         self._llm = None
-        self._store = None
+        self._cache = None